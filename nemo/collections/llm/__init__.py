@@ -1,73 +1,169 @@
-# This is here to import it once, which improves the speed of launch when in debug-mode
-try:
-    import transformer_engine  # noqa
-except ImportError:
-    pass
+# Names exported by this package are resolved lazily (PEP 562) so that `import nemo.collections.llm`
+# does not pull in Megatron-Core, Transformer Engine and every model/recipe module up front.
+# The TYPE_CHECKING block below mirrors `_LAZY_ATTRS` for static analysis and IDE completion.
+# NeMo-Run CLI tasks and factories are registered by `nemo.collections.llm.run_factories`,
+# which is the `run.factories` entry point.
 
-from nemo.collections.llm import peft, tokenizer
-from nemo.collections.llm.api import export_ckpt, finetune, import_ckpt, pretrain, train, validate
-from nemo.collections.llm.gpt.data import (
-    DollyDataModule,
-    FineTuningDataModule,
-    MockDataModule,
-    PreTrainingDataModule,
-    SquadDataModule,
-)
-from nemo.collections.llm.gpt.data.api import dolly, mock, squad
-from nemo.collections.llm.gpt.model import (
-    Baichuan2Config,
-    Baichuan2Config7B,
-    Baichuan2Model,
-    ChatGLM2Config6B,
-    ChatGLM3Config6B,
-    ChatGLMConfig,
-    ChatGLMModel,
-    CodeGemmaConfig2B,
-    CodeGemmaConfig7B,
-    CodeLlamaConfig7B,
-    CodeLlamaConfig13B,
-    CodeLlamaConfig34B,
-    CodeLlamaConfig70B,
-    GemmaConfig,
-    GemmaConfig2B,
-    GemmaConfig7B,
-    GemmaModel,
-    GPTConfig,
-    GPTModel,
-    Llama2Config7B,
-    Llama2Config13B,
-    Llama2Config70B,
-    Llama3Config8B,
-    Llama3Config70B,
-    LlamaConfig,
-    LlamaModel,
-    MaskedTokenLossReduction,
-    MistralConfig7B,
-    MistralModel,
-    MixtralConfig8x3B,
-    MixtralConfig8x7B,
-    MixtralConfig8x22B,
-    MixtralModel,
-    Nemotron3Config4B,
-    Nemotron3Config8B,
-    Nemotron4Config15B,
-    Nemotron4Config22B,
-    Nemotron4Config340B,
-    NemotronConfig,
-    NemotronModel,
-    gpt_data_step,
-    gpt_forward_step,
-)
-from nemo.collections.llm.recipes import *  # noqa
-from nemo.utils import logging
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-try:
-    from nemo.collections.llm.api import deploy
-except ImportError as error:
-    deploy = None
-    logging.warning(f"The deploy module could not be imported: {error}")
+if TYPE_CHECKING:
+    from nemo.collections.llm import peft, tokenizer
+    from nemo.collections.llm.api import deploy, export_ckpt, finetune, import_ckpt, pretrain, train, validate
+    from nemo.collections.llm.gpt.data import (
+        DollyDataModule,
+        FineTuningDataModule,
+        MockDataModule,
+        PreTrainingDataModule,
+        SquadDataModule,
+    )
+    from nemo.collections.llm.gpt.data.api import dolly, mock, squad
+    from nemo.collections.llm.gpt.model import (
+        Baichuan2Config,
+        Baichuan2Config7B,
+        Baichuan2Model,
+        ChatGLM2Config6B,
+        ChatGLM3Config6B,
+        ChatGLMConfig,
+        ChatGLMModel,
+        CodeGemmaConfig2B,
+        CodeGemmaConfig7B,
+        CodeLlamaConfig7B,
+        CodeLlamaConfig13B,
+        CodeLlamaConfig34B,
+        CodeLlamaConfig70B,
+        GemmaConfig,
+        GemmaConfig2B,
+        GemmaConfig7B,
+        GemmaModel,
+        GPTConfig,
+        GPTModel,
+        Llama2Config7B,
+        Llama2Config13B,
+        Llama2Config70B,
+        Llama3Config8B,
+        Llama3Config70B,
+        LlamaConfig,
+        LlamaModel,
+        MaskedTokenLossReduction,
+        MistralConfig7B,
+        MistralModel,
+        MixtralConfig8x3B,
+        MixtralConfig8x7B,
+        MixtralConfig8x22B,
+        MixtralModel,
+        Nemotron3Config4B,
+        Nemotron3Config8B,
+        Nemotron4Config15B,
+        Nemotron4Config22B,
+        Nemotron4Config340B,
+        NemotronConfig,
+        NemotronModel,
+        gpt_data_step,
+        gpt_forward_step,
+    )
+    from nemo.collections.llm.recipes import (
+        adam,
+        default_log,
+        default_resume,
+        llama3_8b,
+        llama3_8b_16k,
+        llama3_8b_64k,
+        llama3_70b,
+        llama3_70b_16k,
+        llama3_70b_64k,
+        mistral,
+        mixtral_8x3b,
+        mixtral_8x3b_16k,
+        mixtral_8x3b_64k,
+        mixtral_8x7b,
+        mixtral_8x7b_16k,
+        mixtral_8x7b_64k,
+        mixtral_8x22b,
+    )
 
-__all__ = [
+_SUBMODULES = ["api", "fn", "gpt", "peft", "recipes", "tokenizer", "utils"]
+
+# Maps the module that defines each attribute to the attribute names re-exported from this package.
+_LAZY_ATTRS: Dict[str, List[str]] = {
+    "nemo.collections.llm.api": ["export_ckpt", "finetune", "import_ckpt", "pretrain", "train", "validate"],
+    "nemo.collections.llm.gpt.data": [
+        "DollyDataModule",
+        "FineTuningDataModule",
+        "MockDataModule",
+        "PreTrainingDataModule",
+        "SquadDataModule",
+    ],
+    "nemo.collections.llm.gpt.data.api": ["dolly", "mock", "squad"],
+    "nemo.collections.llm.gpt.model": [
+        "Baichuan2Config",
+        "Baichuan2Config7B",
+        "Baichuan2Model",
+        "ChatGLM2Config6B",
+        "ChatGLM3Config6B",
+        "ChatGLMConfig",
+        "ChatGLMModel",
+        "CodeGemmaConfig2B",
+        "CodeGemmaConfig7B",
+        "CodeLlamaConfig7B",
+        "CodeLlamaConfig13B",
+        "CodeLlamaConfig34B",
+        "CodeLlamaConfig70B",
+        "GemmaConfig",
+        "GemmaConfig2B",
+        "GemmaConfig7B",
+        "GemmaModel",
+        "GPTConfig",
+        "GPTModel",
+        "Llama2Config7B",
+        "Llama2Config13B",
+        "Llama2Config70B",
+        "Llama3Config8B",
+        "Llama3Config70B",
+        "LlamaConfig",
+        "LlamaModel",
+        "MaskedTokenLossReduction",
+        "MistralConfig7B",
+        "MistralModel",
+        "MixtralConfig8x3B",
+        "MixtralConfig8x7B",
+        "MixtralConfig8x22B",
+        "MixtralModel",
+        "Nemotron3Config4B",
+        "Nemotron3Config8B",
+        "Nemotron4Config15B",
+        "Nemotron4Config22B",
+        "Nemotron4Config340B",
+        "NemotronConfig",
+        "NemotronModel",
+        "gpt_data_step",
+        "gpt_forward_step",
+    ],
+    # Previously re-exported through `from nemo.collections.llm.recipes import *`.
+    "nemo.collections.llm.recipes": [
+        "llama3_8b",
+        "llama3_8b_16k",
+        "llama3_8b_64k",
+        "llama3_70b",
+        "llama3_70b_16k",
+        "llama3_70b_64k",
+        "mistral",
+        "mixtral_8x3b",
+        "mixtral_8x3b_16k",
+        "mixtral_8x3b_64k",
+        "mixtral_8x7b",
+        "mixtral_8x7b_16k",
+        "mixtral_8x7b_64k",
+        "mixtral_8x22b",
+        "adam",
+        "default_log",
+        "default_resume",
+    ],
+}
+_ATTR_TO_MODULE = {attr: module for module, attrs in _LAZY_ATTRS.items() for attr in attrs}
+
+# `__all__` itself is resolved in `__getattr__`, since "deploy" is only exported when it imports.
+_EXPORTS = [
     "MockDataModule",
     "GPTModel",
     "GPTConfig",
@@ -128,6 +224,40 @@ __all__ = [
     "peft",
 ]
 
-# add 'deploy' to __all__ if it was successfully imported
-if deploy is not None:
-    __all__.append("deploy")
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name == "deploy":
+        try:
+            from nemo.collections.llm.api import deploy
+        except ImportError as error:
+            from nemo.utils import logging
+
+            deploy = None
+            logging.warning(f"The deploy module could not be imported: {error}")
+        globals()["deploy"] = deploy
+        return deploy
+
+    if name == "__all__":
+        exports = list(_EXPORTS)
+        # add 'deploy' to __all__ if it was successfully imported
+        deploy = globals()["deploy"] if "deploy" in globals() else __getattr__("deploy")
+        if deploy is not None:
+            exports.append("deploy")
+        globals()["__all__"] = exports
+        return exports
+
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass `__getattr__`.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_ATTR_TO_MODULE) | {"deploy", "__all__"})
@@ -0,0 +1,8 @@
+"""NeMo-Run entry point for the ``llm`` namespace.
+
+``setup.py`` registers this module under the ``run.factories`` entry-point group. Importing it registers
+the ``@task(namespace="llm")`` CLI tasks in :mod:`nemo.collections.llm.api` and the ``@factory`` recipes
+in :mod:`nemo.collections.llm.recipes`, which the lazily loaded package ``__init__`` does not import.
+"""
+
+from nemo.collections.llm import api, recipes  # noqa: F401
@@ -54,10 +54,11 @@ class BertEmbeddingHead(nn.Module):
     def forward(self, token_embeddings: Tensor, attention_mask: Tensor):
 
         token_embeddings = token_embeddings.permute(1, 0, 2)
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-        sum_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1)
+        # Keep the mask as [batch, seq, 1], broadcasting across the hidden dimension happens in the multiply.
+        input_mask = attention_mask.unsqueeze(-1).float()
+        sum_embeddings = torch.sum(token_embeddings * input_mask, 1)
 
-        sum_mask = input_mask_expanded.sum(1)
+        sum_mask = input_mask.sum(1)
 
         sum_mask = torch.clamp(sum_mask, min=1e-9)
 
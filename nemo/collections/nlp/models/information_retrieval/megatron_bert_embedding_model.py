@@ -23,7 +23,6 @@ from megatron.core.models.bert.bert_layer_specs import bert_layer_with_transform
 from omegaconf import DictConfig, OmegaConf, open_dict
 from omegaconf.dictconfig import DictConfig
 from pytorch_lightning.trainer.trainer import Trainer
-from torch.distributed import all_gather as all_gather_no_backprop
 from torch.distributed.nn.functional import all_gather as all_gather_with_backprop
 
 from nemo.collections.nlp.data.information_retrieval.bert_embedding_dataset import BertEmbeddingDataset
@@ -89,9 +88,23 @@ class MegatronBertEmbeddingModel(MegatronBertModel):
         softmax_temp = cfg.get('softmax_temp', 0.05)
         self.scale = 1.0 / softmax_temp
         self.hard_negatives_to_train = self.cfg.data.get("hard_negatives_to_train", 4)
+        self.num_tensors_per_example = 2 + self.hard_negatives_to_train
         self.global_inbatch_negatives = self.cfg.get("global_inbatch_negatives", True)
         self.backprop_type = self.cfg.get("backprop_type", "local")
         assert self.backprop_type in ["local", "global"], "Backprop type must be `local` or `global`"
+        # Capture the contrastive scoring + cross entropy tail of the loss in a CUDA graph once shapes are known.
+        self.cuda_graph_loss = self.cfg.get("cuda_graph_loss", False)
+        if self.cuda_graph_loss and self.cfg.get('virtual_pipeline_model_parallel_size', None) is not None:
+            # The interleaved schedule runs several forwards before their backwards, which would overwrite
+            # the static graph buffers of an earlier microbatch before its gradients are computed.
+            logging.warning("cuda_graph_loss is not supported with the interleaved pipeline schedule, disabling it.")
+            self.cuda_graph_loss = False
+        self._graphed_contrastive_loss = None
+        self._graphed_contrastive_loss_key = None
+        # Data parallel handles are resolved on first use since model parallel may not be initialized yet.
+        self._data_parallel_world_size = None
+        self._data_parallel_rank = None
+        self._data_parallel_group = None
 
     def model_provider_func(self, pre_process, post_process):
         cfg = self.cfg
@@ -669,15 +682,32 @@ class MegatronBertEmbeddingModel(MegatronBertModel):
             'lm loss': _blank,
         }
 
+    def _ensure_data_parallel_handles(self):
+        if self._data_parallel_world_size is None:
+            self._data_parallel_world_size = parallel_state.get_data_parallel_world_size()
+            self._data_parallel_rank = parallel_state.get_data_parallel_rank()
+            self._data_parallel_group = parallel_state.get_data_parallel_group()
+
     def _gather_global_inbatch_representations(self, local_tensor):
         local_tensor = local_tensor.contiguous()
+        self._ensure_data_parallel_handles()
+        data_parallel_world_size = self._data_parallel_world_size
+        if data_parallel_world_size == 1:
+            # Nothing to gather, skip the collective.
+            return local_tensor
+
         if self.backprop_type == 'local':
-            global_tensors = [
-                torch.zeros_like(local_tensor) for _ in range(parallel_state.get_data_parallel_world_size())
-            ]
-            all_gather_no_backprop(global_tensors, local_tensor, group=parallel_state.get_data_parallel_group())
-            global_tensors[parallel_state.get_data_parallel_rank()] = local_tensor
-            global_tensors = torch.cat(global_tensors, dim=0)
+            local_size = local_tensor.shape[0]
+            global_tensors = torch.empty(
+                (data_parallel_world_size * local_size, *local_tensor.shape[1:]),
+                dtype=local_tensor.dtype,
+                device=local_tensor.device,
+            )
+            torch.distributed.all_gather_into_tensor(global_tensors, local_tensor, group=self._data_parallel_group)
+            # The gathered rows carry no autograd history, write the local rows back so gradients
+            # still flow to this rank's outputs.
+            rank = self._data_parallel_rank
+            global_tensors[rank * local_size : (rank + 1) * local_size] = local_tensor
 
         else:
             global_tensors = all_gather_with_backprop(local_tensor)
@@ -691,27 +721,56 @@ class MegatronBertEmbeddingModel(MegatronBertModel):
         if self.trainer.testing:
             return self.inference_loss_func(output_tensor)
 
-        num_tensors_per_example = 2 + self.hard_negatives_to_train
+        if self.cuda_graph_loss and self.trainer.training:
+            loss = self._maybe_graphed_contrastive_loss(output_tensor)
+        else:
+            loss = self._contrastive_loss(output_tensor)
+        return {'lm loss': loss}
+
+    def _maybe_graphed_contrastive_loss(self, output_tensor):
+        """Runs `_contrastive_loss` through a CUDA graph captured for the first shape seen in training.
+
+        Batches with a different shape (e.g. a smaller last batch) fall back to eager execution. The graph
+        reuses static buffers, so each replay's backward must run before the next replay, which holds on the
+        last pipeline stage of the non-interleaved schedules. `cuda_graph_loss` is therefore switched off in
+        `__init__` when `virtual_pipeline_model_parallel_size` is set. The graph can't be captured or replayed
+        under autocast, so the loss also runs eagerly while autocast is enabled.
+        """
+        if torch.is_autocast_enabled():
+            return self._contrastive_loss(output_tensor)
+        key = (tuple(output_tensor.shape), output_tensor.dtype, output_tensor.device, output_tensor.requires_grad)
+        if self._graphed_contrastive_loss is None:
+            sample_output_tensor = torch.randn(
+                output_tensor.shape,
+                dtype=output_tensor.dtype,
+                device=output_tensor.device,
+                requires_grad=output_tensor.requires_grad,
+            )
+            self._graphed_contrastive_loss = torch.cuda.make_graphed_callables(
+                self._contrastive_loss, (sample_output_tensor,)
+            )
+            self._graphed_contrastive_loss_key = key
+        if key != self._graphed_contrastive_loss_key:
+            return self._contrastive_loss(output_tensor)
+        # The graph output is a static buffer overwritten on the next replay, keep our own copy.
+        return self._graphed_contrastive_loss(output_tensor).clone()
+
+    def _contrastive_loss(self, output_tensor):
+        num_tensors_per_example = self.num_tensors_per_example
         bs = output_tensor.shape[0] // num_tensors_per_example
-        chunks = output_tensor.chunk(bs)
-        queries = torch.stack([item[0] for item in chunks])  # shape (bs, embedding_dim)
-        positives = torch.stack([item[1] for item in chunks])  # shape (bs, embedding_dim)
+        # Examples are laid out contiguously as [query, positive, negatives...], so a single
+        # reshape separates them without a per-example Python loop.
+        output_tensor = output_tensor.reshape(bs, num_tensors_per_example, -1)
+        queries = output_tensor[:, 0]  # shape (bs, embedding_dim)
+        positives = output_tensor[:, 1]  # shape (bs, embedding_dim)
+        hard_negs = output_tensor[:, 2:]  # shape (bs, num_negatives, embedding_dim)
 
         pos_inbatch_negs_scores = torch.mm(
             queries, positives.transpose(0, 1)
         )  # shape (bs, bs); each positive is negative for other queries.
 
-        hard_negs = [
-            torch.stack([item[i + 2] for item in chunks]) for i in range(self.hard_negatives_to_train)
-        ]  # List of length "num_negatives", each tensor of shape (bs, embedding_dim)
-
-        hard_negs_scores = (
-            torch.multiply(
-                queries.unsqueeze(0).repeat(len(hard_negs), 1, 1),
-                torch.stack(hard_negs),
-            )
-            .sum(axis=-1)
-            .T
+        hard_negs_scores = torch.einsum(
+            'bh,bnh->bn', queries, hard_negs
         )  # shape = (bs, num_negatives); Hard negatives are not shared between queries.
 
         scores = torch.cat([pos_inbatch_negs_scores, hard_negs_scores], axis=1)
@@ -719,8 +778,8 @@ class MegatronBertEmbeddingModel(MegatronBertModel):
         scores = scores.clamp(-1.0, 1.0)
         scores *= self.scale
 
-        labels = torch.tensor(
-            range(len(scores)), dtype=torch.long, device=scores.device
+        labels = torch.arange(
+            scores.shape[0], dtype=torch.long, device=scores.device
         )  # Indices of the (query, positive) pairs
 
-        return {'lm loss': self.cross_entropy_loss(scores, labels)}
+        return self.cross_entropy_loss(scores, labels)
@@ -49,12 +49,23 @@ def listify(tensor):
 
 def _gather_global_inbatch_representations(local_eos_tensor):
     local_eos_tensor = local_eos_tensor.contiguous()
-    global_eos_tensors = [
-        torch.zeros_like(local_eos_tensor) for _ in range(parallel_state.get_data_parallel_world_size())
-    ]
-    torch.distributed.all_gather(global_eos_tensors, local_eos_tensor, group=parallel_state.get_data_parallel_group())
-    global_eos_tensors[parallel_state.get_data_parallel_rank()] = local_eos_tensor
-    global_eos_tensors = torch.cat(global_eos_tensors, dim=0)
+    data_parallel_world_size = parallel_state.get_data_parallel_world_size()
+    if data_parallel_world_size == 1:
+        # Nothing to gather, skip the collective.
+        return local_eos_tensor
+    local_size = local_eos_tensor.shape[0]
+    global_eos_tensors = torch.empty(
+        (data_parallel_world_size * local_size, *local_eos_tensor.shape[1:]),
+        dtype=local_eos_tensor.dtype,
+        device=local_eos_tensor.device,
+    )
+    torch.distributed.all_gather_into_tensor(
+        global_eos_tensors, local_eos_tensor, group=parallel_state.get_data_parallel_group()
+    )
+    # The gathered rows carry no autograd history, write the local rows back so gradients
+    # still flow to this rank's outputs.
+    rank = parallel_state.get_data_parallel_rank()
+    global_eos_tensors[rank * local_size : (rank + 1) * local_size] = local_eos_tensor
     return global_eos_tensors
 
 
@@ -64,6 +75,10 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
         self.temperature = self.cfg.get('temperature', 0.02)
         self.use_all_possible_negatives = self.cfg.get("use_all_possible_negatives", True)
         self.global_inbatch_negatives = self.cfg.get("global_inbatch_negatives", True)
+        self.context_parallel_size = self.cfg.get('context_parallel_size', 1)
+        self.bf16_contrastive_scores = self.cfg.get("bf16_contrastive_scores", False)
+        # Resolved on first use since model parallel may not be initialized yet.
+        self._context_parallel_group = None
         if self.cfg.get("do_mrl", False):
             min_mrl = self.cfg.get("min_mrl_dim", int(np.log2(32))) - 1
             max_mrl = int(np.log2(self.cfg.hidden_size // 2))
@@ -134,7 +149,7 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
                 )
             num_train_samples = [self.trainer.max_steps * data_cfg.global_batch_size]
             _, _, num_train_samples_per_dataset = get_datasets_weights_and_num_samples(data_prefix, num_train_samples)
-            num_train_samples_after_blend = sum([x[0] for x in num_train_samples_per_dataset])
+            num_train_samples_after_blend = sum(x[0] for x in num_train_samples_per_dataset)
         else:
             num_query_files = len(data_cfg.query_file_names) if data_cfg.query_file_names is not None else 0
             num_doc_files = len(data_cfg.doc_file_names) if data_cfg.doc_file_names is not None else 0
@@ -156,29 +171,33 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
         pad_seq_length_to_mult = (
             8 * self.cfg.get('tensor_model_parallel_size', 1) if self.cfg.get('sequence_parallel', False) else 16
         )
+        # Arguments shared by every dataset built below, resolved from the config only once.
+        common_dataset_kwargs = dict(
+            tokenizer=self.tokenizer,
+            max_seq_length=data_cfg.max_seq_length,
+            min_seq_length=data_cfg.min_seq_length,
+            add_bos=data_cfg.get('add_bos', False),
+            add_eos=data_cfg.get('add_eos', True),
+            seed=data_cfg.get('seed', 1234),
+            index_mapping_dir=data_cfg.get('index_mapping_dir', None),
+            virtual_tokens=self.virtual_tokens,
+            memmap_workers=data_cfg.get(
+                'memmap_workers', None
+            ),  # used to set num. of workers to create the memmap index files
+            truncation_method=data_cfg.get(
+                'truncation_method', 'right'
+            ),  # used to choose truncation method. Options: ['random', 'left', 'right']
+            special_tokens=self.cfg.data.get(
+                'chat_prompt_tokens', None
+            ),  # special tokens for the chat prompts, a dictionary of {token_type: token}. Default: {'system_turn_start': '<extra_id_0>', 'turn_start': '<extra_id_1>', 'label_start': '<extra_id_2>', 'end_of_turn': '\n', "end_of_name": "\n"}
+        )
         if is_train:
             datasets = []
             for file_path, num_samples in zip(data_cfg.file_names, num_train_samples_per_dataset):
                 dataset = GPTEmbeddingDataset(
                     file_path=file_path,
-                    tokenizer=self.tokenizer,
-                    max_seq_length=data_cfg.max_seq_length,
-                    min_seq_length=data_cfg.min_seq_length,
-                    add_bos=data_cfg.get('add_bos', False),
-                    add_eos=data_cfg.get('add_eos', True),
                     max_num_samples=num_samples[0],
-                    seed=data_cfg.get('seed', 1234),
-                    index_mapping_dir=data_cfg.get('index_mapping_dir', None),
-                    virtual_tokens=self.virtual_tokens,
-                    memmap_workers=data_cfg.get(
-                        'memmap_workers', None
-                    ),  # used to set num. of workers to create the memmap index files
-                    truncation_method=data_cfg.get(
-                        'truncation_method', 'right'
-                    ),  # used to choose truncation method. Options: ['random', 'left', 'right']
-                    special_tokens=self.cfg.data.get(
-                        'chat_prompt_tokens', None
-                    ),  # special tokens for the chat prompts, a dictionary of {token_type: token}. Default: {'system_turn_start': '<extra_id_0>', 'turn_start': '<extra_id_1>', 'label_start': '<extra_id_2>', 'end_of_turn': '\n', "end_of_name": "\n"}
+                    **common_dataset_kwargs,
                 )
                 datasets.append(dataset)
             if packed_sequence:
@@ -194,47 +213,15 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
 
             query_dataset = GPTEmbeddingDataset(
                 file_path=data_cfg.query_file_names[0],
-                tokenizer=self.tokenizer,
-                max_seq_length=data_cfg.max_seq_length,
-                min_seq_length=data_cfg.min_seq_length,
-                add_bos=data_cfg.get('add_bos', False),
-                add_eos=data_cfg.get('add_eos', True),
                 max_num_samples=None,
-                seed=data_cfg.get('seed', 1234),
-                index_mapping_dir=data_cfg.get('index_mapping_dir', None),
-                virtual_tokens=self.virtual_tokens,
-                memmap_workers=data_cfg.get(
-                    'memmap_workers', None
-                ),  # used to set num. of workers to create the memmap index files
-                truncation_method=data_cfg.get(
-                    'truncation_method', 'right'
-                ),  # used to choose truncation method. Options: ['random', 'left', 'right']
-                special_tokens=self.cfg.data.get(
-                    'chat_prompt_tokens', None
-                ),  # special tokens for the chat prompts, a dictionary of {token_type: token}. Default: {'system_turn_start': '<extra_id_0>', 'turn_start': '<extra_id_1>', 'label_start': '<extra_id_2>', 'end_of_turn': '\n', "end_of_name": "\n"}
                 data_type="query",
+                **common_dataset_kwargs,
             )
             doc_dataset = GPTEmbeddingDataset(
                 file_path=data_cfg.doc_file_names[0],
-                tokenizer=self.tokenizer,
-                max_seq_length=data_cfg.max_seq_length,
-                min_seq_length=data_cfg.min_seq_length,
-                add_bos=data_cfg.get('add_bos', False),
-                add_eos=data_cfg.get('add_eos', True),
                 max_num_samples=None,
-                seed=data_cfg.get('seed', 1234),
-                index_mapping_dir=data_cfg.get('index_mapping_dir', None),
-                virtual_tokens=self.virtual_tokens,
-                memmap_workers=data_cfg.get(
-                    'memmap_workers', None
-                ),  # used to set num. of workers to create the memmap index files
-                truncation_method=data_cfg.get(
-                    'truncation_method', 'right'
-                ),  # used to choose truncation method. Options: ['random', 'left', 'right']
-                special_tokens=self.cfg.data.get(
-                    'chat_prompt_tokens', None
-                ),  # special tokens for the chat prompts, a dictionary of {token_type: token}. Default: {'system_turn_start': '<extra_id_0>', 'turn_start': '<extra_id_1>', 'label_start': '<extra_id_2>', 'end_of_turn': '\n', "end_of_name": "\n"}
                 data_type="doc",
+                **common_dataset_kwargs,
             )
             return [query_dataset, doc_dataset]
 
@@ -401,17 +388,20 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
     def constrastive_scores(self, pos_doc_hs, neg_doc_hs, query_hs, bs, temperature, use_all_possible_negatives=False):
         all_doc_hs = torch.cat([pos_doc_hs, neg_doc_hs], dim=0)  # (2bs) x hidden_size
         cs = torch.mm(query_hs, all_doc_hs.transpose(0, 1))  # (bs) x (2bs)
-        pos_cs = cs[:, :bs].diag()
-        neg_cs = cs[:, bs:].diag()
+        pos_cs = torch.diagonal(cs[:, :bs])
+        neg_cs = torch.diagonal(cs[:, bs:])
         if use_all_possible_negatives:
-            labels = torch.arange(bs, device=cs.device).long()
+            labels = torch.arange(bs, dtype=torch.long, device=cs.device)
         else:
-            labels = torch.zeros(bs, device=cs.device).long()
+            labels = torch.zeros(bs, dtype=torch.long, device=cs.device)
             cs = torch.cat([pos_cs.unsqueeze(1), neg_cs.unsqueeze(1)], dim=1)
-        pos_cs = pos_cs.clone().detach().mean()
-        neg_cs = neg_cs.clone().detach().mean()
-        cs = cs.clamp(-1.0, 1.0)
-        cs = cs / temperature
+        pos_cs = pos_cs.detach().mean()
+        neg_cs = neg_cs.detach().mean()
+        # clamp returns a fresh tensor, so the temperature scaling can be applied in place.
+        cs = cs.clamp(-1.0, 1.0).mul_(1.0 / temperature)
+        if self.bf16_contrastive_scores:
+            # Upcast the logits so the softmax in the cross entropy runs in fp32.
+            cs = cs.float()
         return cs, pos_cs, neg_cs, labels
 
     def inference_loss_func(self, loss_mask, num_valid_tokens_in_ub, eos_tensors):
@@ -428,21 +418,23 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
         }
 
     def loss_func(self, loss_mask, num_valid_tokens_in_ub, output_tensor):
-        idx = torch.arange(output_tensor.shape[1], device=output_tensor.device)
-        eos_tensors = output_tensor[loss_mask, idx, :]
+        # output_tensor is [seq_len, bs, hidden_size] and loss_mask holds the eos position of each sequence.
+        eos_index = loss_mask.view(1, -1, 1).expand(1, -1, output_tensor.size(-1))
+        eos_tensors = output_tensor.gather(0, eos_index).squeeze(0)
         if self.global_inbatch_negatives and self.trainer.training:
             eos_tensors = _gather_global_inbatch_representations(eos_tensors)
         if not self.trainer.training:
             return self.inference_loss_func(loss_mask, num_valid_tokens_in_ub, eos_tensors)
         bs = eos_tensors.shape[0] // 3
+        if self.bf16_contrastive_scores and eos_tensors.dtype == torch.float32:
+            # Only the relative ordering of the cosine scores matters, so bf16 is accurate enough for them.
+            eos_tensors = eos_tensors.to(torch.bfloat16)
+        # Normalize all representations in one kernel before splitting them into views.
+        eos_tensors = torch.nn.functional.normalize(eos_tensors, dim=1)
         query_hs = eos_tensors[::3, :]  # every third tensor is a query (bs x hidden_size)
         pos_doc_hs = eos_tensors[1::3, :]  # every third tensor is a positive doc (bs x hidden_size)
         neg_doc_hs = eos_tensors[2::3, :]  # every third tensor is a negative doc (bs x hidden_size)
 
-        query_hs = torch.nn.functional.normalize(query_hs, dim=1)
-        pos_doc_hs = torch.nn.functional.normalize(pos_doc_hs, dim=1)
-        neg_doc_hs = torch.nn.functional.normalize(neg_doc_hs, dim=1)
-
         cs, pos_cs, neg_cs, labels = self.constrastive_scores(
             pos_doc_hs, neg_doc_hs, query_hs, bs, self.temperature, self.use_all_possible_negatives
         )
@@ -459,11 +451,12 @@ class MegatronGPTEmbeddingModel(MegatronGPTSFTModel):
                 )
                 loss += torch.nn.functional.cross_entropy(cs_dim, labels)
 
-        cp_size = self.cfg.get('context_parallel_size', 1)
-        if cp_size > 1:
-            torch.distributed.all_reduce(loss, group=parallel_state.get_context_parallel_group())
-        query_hs = query_hs.clone().detach()
-        pos_doc_hs = pos_doc_hs.clone().detach()
+        if self.context_parallel_size > 1:
+            if self._context_parallel_group is None:
+                self._context_parallel_group = parallel_state.get_context_parallel_group()
+            torch.distributed.all_reduce(loss, group=self._context_parallel_group)
+        query_hs = query_hs.detach()
+        pos_doc_hs = pos_doc_hs.detach()
         diff_cs = pos_cs - neg_cs
         return {
             "loss": loss,
@@ -106,7 +106,7 @@ class MegatronGPTRerankerModel(MegatronGPTEmbeddingModel):
                 )
             num_train_samples = [self.trainer.max_steps * data_cfg.global_batch_size]
             _, _, num_train_samples_per_dataset = get_datasets_weights_and_num_samples(data_prefix, num_train_samples)
-            num_train_samples_after_blend = sum([x[0] for x in num_train_samples_per_dataset])
+            num_train_samples_after_blend = sum(x[0] for x in num_train_samples_per_dataset)
         else:
             num_train_samples_per_dataset = [[None]] * len(data_cfg.file_names)
 
@@ -189,8 +189,8 @@ class MegatronGPTRerankerModel(MegatronGPTEmbeddingModel):
         }
 
     def loss_func(self, loss_mask, num_valid_tokens_in_ub, output_tensor):
-        idx = torch.arange(output_tensor.shape[1], device=output_tensor.device)
-        eos_tensors = output_tensor[loss_mask, idx, :]  # (bs x 1)
+        eos_index = loss_mask.view(1, -1, 1).expand(1, -1, output_tensor.size(-1))
+        eos_tensors = output_tensor.gather(0, eos_index).squeeze(0)  # (bs x 1)
         if self.global_inbatch_negatives and self.trainer.training:
             eos_tensors = _gather_global_inbatch_representations(eos_tensors)
         if not self.trainer.training:
@@ -867,6 +867,10 @@ class MegatronGPTSFTModel(NLPAdapterModelMixin, MegatronGPTModel):
             drop_last=data_cfg.drop_last,
             pad_samples_to_global_batch_size=not data_cfg.drop_last,
         )
+        dataloader_kwargs = {}
+        if data_cfg.num_workers > 0 and data_cfg.get('prefetch_factor', None) is not None:
+            # Number of batches each worker loads ahead of time, lets data loading overlap with the training step.
+            dataloader_kwargs['prefetch_factor'] = data_cfg.prefetch_factor
         return torch.utils.data.DataLoader(
             dataset,
             batch_sampler=batch_sampler,
@@ -874,6 +878,7 @@ class MegatronGPTSFTModel(NLPAdapterModelMixin, MegatronGPTModel):
             num_workers=data_cfg.num_workers,
             pin_memory=data_cfg.pin_memory,
             persistent_workers=True if data_cfg.num_workers > 0 else False,
+            **dataloader_kwargs,
         )
 
     def setup_training_dataloader(self):
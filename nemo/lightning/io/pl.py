@@ -69,6 +69,11 @@ class MegatronCheckpointIO(AsyncCompatibleCheckpointIO, IOMixin):
 
     .. warning::  This is an :ref:`experimental <versioning:Experimental API>` feature.
 
+    With ``reuse_sharding_validation=True`` the sharding layout of every save is hashed and, if it matches
+    the previous save on all ranks, the previous sharding validation is reused instead of gathering the
+    metadata of all shards again. This costs one small all-reduce and a host sync per save.
+    ``assume_constant_structure=True`` skips validation after the first save without any check.
+
     """
 
     def __init__(
@@ -81,6 +86,7 @@ class MegatronCheckpointIO(AsyncCompatibleCheckpointIO, IOMixin):
         parallel_save: bool = True,
         parallel_save_within_dp: bool = False,
         parallel_load: bool = False,
+        reuse_sharding_validation: bool = False,
     ):
         self.save_ckpt_format = save_ckpt_format
         self.load_directly_on_device = load_directly_on_device
@@ -90,9 +96,11 @@ class MegatronCheckpointIO(AsyncCompatibleCheckpointIO, IOMixin):
         self.parallel_save = parallel_save
         self.parallel_save_within_dp = parallel_save_within_dp
         self.parallel_load = parallel_load
+        self.reuse_sharding_validation = reuse_sharding_validation
 
         self._save_sharded_strategy = None
         self.validated_consistency = False
+        self._sharded_structure_fingerprint = None
 
     @override
     def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
@@ -124,7 +132,15 @@ class MegatronCheckpointIO(AsyncCompatibleCheckpointIO, IOMixin):
             return
         fs.makedirs(checkpoint_dir, exist_ok=True)
 
-        validate_sharding_integrity = not (self.validated_consistency and self.assume_constant_structure)
+        if self.assume_constant_structure:
+            structure_unchanged = True
+        elif self.reuse_sharding_validation:
+            # Sharding validation gathers the metadata of every shard on every rank, which is
+            # only worth redoing when the sharding layout changed since the last validated save.
+            structure_unchanged = self._sharded_structure_unchanged(checkpoint)
+        else:
+            structure_unchanged = False
+        validate_sharding_integrity = not (self.validated_consistency and structure_unchanged)
         self.validated_consistency = True
 
         try:
@@ -210,6 +226,19 @@ class MegatronCheckpointIO(AsyncCompatibleCheckpointIO, IOMixin):
             fs.rm(path, recursive=True)
             log.debug(f"Removed checkpoint: {path}")
 
+    def _sharded_structure_unchanged(self, checkpoint: Dict[str, Any]) -> bool:
+        """Checks whether the sharding layout of `checkpoint` matches the previous save on all ranks."""
+        fingerprint = _sharded_structure_fingerprint(checkpoint)
+        unchanged = fingerprint == self._sharded_structure_fingerprint
+        self._sharded_structure_fingerprint = fingerprint
+
+        if torch.distributed.is_available() and torch.distributed.is_initialized():
+            device = 'cuda' if torch.distributed.get_backend() == 'nccl' else 'cpu'
+            flag = torch.tensor([int(unchanged)], dtype=torch.int32, device=device)
+            torch.distributed.all_reduce(flag, op=torch.distributed.ReduceOp.MIN)
+            unchanged = bool(flag.item())
+        return unchanged
+
     def _determine_dist_ckpt_save_strategy(self):
         """Determine the saving strategy based on constructor args.
 
@@ -248,6 +277,28 @@ class MegatronCheckpointIO(AsyncCompatibleCheckpointIO, IOMixin):
         return self._save_sharded_strategy
 
 
+def _sharded_structure_fingerprint(checkpoint: Dict[str, Any]) -> int:
+    """Hashes the sharding metadata (keys, shapes, offsets, replicas) of all sharded objects in `checkpoint`."""
+    from megatron.core.dist_checkpointing.dict_utils import nested_values
+    from megatron.core.dist_checkpointing.mapping import ShardedBase
+
+    def _shard_signature(sh_base):
+        flattened_range = getattr(sh_base, 'flattened_range', None)
+        data = getattr(sh_base, 'data', None)
+        return (
+            type(sh_base).__name__,
+            sh_base.key,
+            getattr(sh_base, 'global_shape', None),
+            getattr(sh_base, 'global_offset', None),
+            getattr(sh_base, 'axis_fragmentations', None),
+            getattr(sh_base, 'replica_id', None),
+            None if flattened_range is None else (flattened_range.start, flattened_range.stop),
+            tuple(data.shape) if isinstance(data, torch.Tensor) else None,
+        )
+
+    return hash(tuple(_shard_signature(v) for v in nested_values(checkpoint) if isinstance(v, ShardedBase)))
+
+
 def _fix_tensors_device(ckpt: Dict) -> Dict:
     """Ensure checkpoint tensors are on the correct device."""
     assert torch.cuda.is_initialized(), (torch.cuda.is_available(), torch.cuda.is_initialized())
@@ -93,10 +93,16 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
             'torch_dist' or 'zarr'. Defaults to 'torch_dist'.
         ckpt_async_save (bool): Whether to save checkpoints asynchronously to reduce checkpointing overhead.
             Defaults to False.
+        ckpt_async_persistent_worker (bool): If true, async saves are executed by a single long-lived
+            worker process instead of a new process forked for every save. Requires a MCore version
+            supporting persistent async workers. Defaults to False.
         ckpt_torch_dist_multiproc (int): Number of extra processes per rank used during ckpt save
             with PyTorch distributed format. Defaults to None.
         ckpt_assume_constant_structure (bool): Allows caching some computation across checkpoint saves.
             Set to True only if the state dict structure doesn't change within a single job.
+        ckpt_reuse_sharding_validation (bool): If true, the sharding layout of each save is hashed and the
+            sharding validation of the previous save is reused when the layout is unchanged on all ranks.
+            Adds one small all-reduce per save. Defaults to False.
         ckpt_parallel_save (bool): If true, each worker will write its own part of the dist checkpoint.
             Defaults to True.
         ckpt_parallel_save_within_dp (bool): If true, save will be parallelized only within a DP group
@@ -146,8 +152,10 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
         pipeline_dtype: Optional[torch.dtype] = None,
         save_ckpt_format: str = 'torch_dist',
         ckpt_async_save: bool = False,
+        ckpt_async_persistent_worker: bool = False,
         ckpt_torch_dist_multiproc: int = None,  ## TODO(ashors): put elsewhere?
         ckpt_assume_constant_structure: bool = False,
+        ckpt_reuse_sharding_validation: bool = False,
         ckpt_parallel_save: bool = True,
         ckpt_parallel_save_within_dp: bool = False,
         ckpt_parallel_load: bool = False,
@@ -186,8 +194,10 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
 
         self.save_ckpt_format = save_ckpt_format
         self.async_save = ckpt_async_save
+        self.async_persistent_worker = ckpt_async_persistent_worker
         self.torch_dist_multiproc = ckpt_torch_dist_multiproc
         self.assume_constant_structure = ckpt_assume_constant_structure
+        self.reuse_sharding_validation = ckpt_reuse_sharding_validation
         self.parallel_save = ckpt_parallel_save
         self.parallel_save_within_dp = ckpt_parallel_save_within_dp
         self.parallel_load = ckpt_parallel_load
@@ -436,9 +446,10 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
 
     def _setup_parallel_ranks(self) -> None:
         self.set_world_ranks()
-        env = cast(ClusterEnvironment, self.cluster_environment)
+        env = self.cluster_environment
+        world_size, global_rank, local_rank = env.world_size(), env.global_rank(), env.local_rank()
 
-        _strategy_lib.init_parallel_ranks(env.world_size(), env.global_rank(), env.local_rank(), self.parallelism)
+        _strategy_lib.init_parallel_ranks(world_size, global_rank, local_rank, self.parallelism)
 
     @override
     def training_step(self, dataloader_iter, *args: Any, **kwargs: Any) -> STEP_OUTPUT:
@@ -563,24 +574,27 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
 
     def _fix_progress_bar(self, trainer: pl.Trainer) -> None:
         callbacks: List[pl.Callback] = cast(List[pl.Callback], getattr(trainer, "callbacks"))
-        contains_megatron_progress, contains_progress = False, False
-        for callback in callbacks:
+        progress_index = None
+        has_plain_bar = False
+        for i, callback in enumerate(callbacks):
             if isinstance(callback, MegatronProgressBar):
-                contains_megatron_progress = True
-            if callback.__class__ == TQDMProgressBar:
-                contains_progress = True
-        if not contains_megatron_progress and contains_progress:
-            for i, callback in enumerate(callbacks):
-                if isinstance(callback, TQDMProgressBar):
-                    if self.replace_progress_bar:
-                        printer = ProgressPrinter(log_interval=self.progress_interval)
-                        printer._trainer = trainer
-                        if not trainer.is_global_zero:
-                            printer.disable()
-                        callbacks[i] = printer
-                    else:
-                        callback.__class__ = MegatronProgressBar
-                    break
+                return
+            if progress_index is None and isinstance(callback, TQDMProgressBar):
+                progress_index = i
+            if type(callback) is TQDMProgressBar:
+                has_plain_bar = True
+        # Only act when a plain TQDMProgressBar is present
+        if progress_index is None or not has_plain_bar:
+            return
+
+        if self.replace_progress_bar:
+            printer = ProgressPrinter(log_interval=self.progress_interval)
+            printer._trainer = trainer
+            if not trainer.is_global_zero:
+                printer.disable()
+            callbacks[progress_index] = printer
+        else:
+            callbacks[progress_index].__class__ = MegatronProgressBar
 
     def optimizer_sharded_state_dict(self, is_loading=False):
         """
@@ -666,13 +680,16 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
                 async_save=self.async_save,
                 torch_dist_multiproc=self.torch_dist_multiproc,
                 assume_constant_structure=self.assume_constant_structure,
+                reuse_sharding_validation=self.reuse_sharding_validation,
                 parallel_save=self.parallel_save,
                 parallel_save_within_dp=self.parallel_save_within_dp,
                 parallel_load=self.parallel_load,
                 load_directly_on_device=self.load_directly_on_device,
             )
             if self.async_save:
-                self._checkpoint_io = AsyncFinalizableCheckpointIO(self._checkpoint_io)
+                self._checkpoint_io = AsyncFinalizableCheckpointIO(
+                    self._checkpoint_io, persistent_worker=self.async_persistent_worker
+                )
         elif isinstance(self._checkpoint_io, _WrappingCheckpointIO):
             self._checkpoint_io.checkpoint_io = MegatronCheckpointIO()
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import os
 import shutil
 from abc import ABC, abstractmethod
@@ -96,17 +97,31 @@ class AsyncFinalizableCheckpointIO(_WrappingCheckpointIO):
     Args:
         checkpoint_io (CheckpointIO): wrapped checkpoint_io object. Must be
             of type AsyncCompatibleCheckpointIO.
+        persistent_worker (bool, optional): if True, async saves are executed by a single
+            long-lived worker process instead of forking a new process for every save.
+            Requires MCore with persistent async worker support. Defaults to False.
     Requires the underlying checkpoint_io.save_checkpoint to return save_fn, save_args, finalize_fn.
     """
 
-    def __init__(self, checkpoint_io: AsyncCompatibleCheckpointIO) -> None:
+    def __init__(self, checkpoint_io: AsyncCompatibleCheckpointIO, persistent_worker: bool = False) -> None:
         if not HAVE_MEGATRON_CORE:
             raise ImportError(IMPORT_ERROR)
         if not isinstance(checkpoint_io, AsyncCompatibleCheckpointIO):
             raise ValueError(f'Incompatible wrapped checkpoint_io type: {type(checkpoint_io)}')
 
         super().__init__(checkpoint_io)
-        self.async_calls_queue = AsyncCallsQueue()
+        self.persistent_worker = False
+        async_queue_kwargs = {}
+        if persistent_worker:
+            if 'persistent' in inspect.signature(AsyncCallsQueue).parameters:
+                self.persistent_worker = True
+                async_queue_kwargs['persistent'] = True
+            else:
+                logging.warning(
+                    'Persistent async checkpoint worker is not supported by the installed MCore version,'
+                    ' falling back to a process per save.'
+                )
+        self.async_calls_queue = AsyncCallsQueue(**async_queue_kwargs)
 
     def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
         """Executes async request returned from the underlying checkpoint_io asynchronously.
@@ -124,9 +139,17 @@ class AsyncFinalizableCheckpointIO(_WrappingCheckpointIO):
                 a callback and is appended to async finalization functions.
 
         Applies underlying checkpoint_io finalize callback first, then the external one (postfix order).
+
+        If a previous async save is still pending, it is finalized (blocking) before the new one is
+        scheduled, so at most one save is in flight and its finalize callbacks run at this point.
         """
         external_finalize_fn = (storage_options or {}).pop('finalize_fn', None)
         assert isinstance(self.checkpoint_io, AsyncCompatibleCheckpointIO), type(self.checkpoint_io)
+        # Each in-flight save keeps a host copy of the state dict alive until it is persisted.
+        # Wait for the previous save before staging a new one so at most one copy is held at a time.
+        # The previous save has normally finished by now, so this rarely blocks.
+        if self.async_calls_queue.get_num_unfinalized_calls() > 0:
+            self.maybe_finalize_save_checkpoint(blocking=True)
         async_request = self.checkpoint_io.save_checkpoint(checkpoint, path, storage_options)
         if external_finalize_fn is not None:
             async_request.add_finalize_fn(external_finalize_fn)
@@ -148,11 +171,15 @@ class AsyncFinalizableCheckpointIO(_WrappingCheckpointIO):
         return len(call_idx_finalized) > 0
 
     def teardown(self) -> None:
-        """Warns if there are any pending checkpoint saves."""
+        """Warns if there are any pending checkpoint saves, otherwise stops the persistent worker (if any)."""
         super().teardown()
         if self.async_calls_queue.get_num_unfinalized_calls() > 0:
             # Can't do finalization now because some ranks might be lost
             logging.warning('Some async checkpoint saves might be not finalized properly.')
+        elif self.persistent_worker:
+            # With nothing left to finalize, closing the queue only stops the persistent worker
+            # and does not run any cross-rank finalization.
+            self.async_calls_queue.close()
 
 
 class AsyncFinalizerCallback(Callback):
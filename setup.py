@@ -274,7 +274,7 @@ setuptools.setup(
     cmdclass={'style': StyleCommand},
     entry_points={
         "run.factories": [
-            "llm = nemo.collections.llm",
+            "llm = nemo.collections.llm.run_factories",
         ],
     },
 )
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import nemo.collections.llm as llm
+
+
+def test_run_factories_entry_point_registers_tasks_and_recipes():
+    # Run in a fresh interpreter, this session may already have imported the modules.
+    code = (
+        "import sys, nemo.collections.llm.run_factories; "
+        "assert 'nemo.collections.llm.api' in sys.modules; "
+        "assert 'nemo.collections.llm.recipes' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_all_skips_deploy_when_it_cannot_be_imported(monkeypatch):
+    monkeypatch.setattr(llm, "deploy", None)
+    monkeypatch.delattr(llm, "__all__", raising=False)
+
+    assert "deploy" not in llm.__all__
+    assert "pretrain" in llm.__all__
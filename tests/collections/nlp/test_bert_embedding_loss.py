@@ -0,0 +1,101 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from nemo.collections.nlp.models.information_retrieval.megatron_bert_embedding_model import MegatronBertEmbeddingModel
+
+
+def _graph_key(tensor):
+    return (tuple(tensor.shape), tensor.dtype, tensor.device, tensor.requires_grad)
+
+
+def _eager_only_model(captured_key=None):
+    eager_calls = []
+
+    def _contrastive_loss(output_tensor):
+        eager_calls.append(output_tensor.shape)
+        return output_tensor.sum()
+
+    def _graphed_contrastive_loss(output_tensor):
+        raise AssertionError("graph must not be replayed")
+
+    model = SimpleNamespace(
+        _contrastive_loss=_contrastive_loss,
+        _graphed_contrastive_loss=_graphed_contrastive_loss,
+        _graphed_contrastive_loss_key=captured_key,
+    )
+    return model, eager_calls
+
+
+def _contrastive_model(hard_negatives_to_train=2):
+    model = SimpleNamespace(
+        num_tensors_per_example=2 + hard_negatives_to_train,
+        scale=1.0 / 0.05,
+        cross_entropy_loss=torch.nn.CrossEntropyLoss(),
+        _graphed_contrastive_loss=None,
+        _graphed_contrastive_loss_key=None,
+    )
+    model._contrastive_loss = functools.partial(MegatronBertEmbeddingModel._contrastive_loss, model)
+    return model
+
+
+class TestGraphedContrastiveLoss:
+    @pytest.mark.unit
+    def test_shape_mismatch_falls_back_to_eager(self):
+        model, eager_calls = _eager_only_model(captured_key=_graph_key(torch.zeros(12, 8)))
+
+        smaller_batch = torch.ones(6, 8)
+        loss = MegatronBertEmbeddingModel._maybe_graphed_contrastive_loss(model, smaller_batch)
+
+        assert eager_calls == [smaller_batch.shape]
+        assert loss.item() == smaller_batch.sum().item()
+
+    @pytest.mark.unit
+    def test_autocast_falls_back_to_eager(self, monkeypatch):
+        model, eager_calls = _eager_only_model()
+        monkeypatch.setattr(torch, 'is_autocast_enabled', lambda: True)
+
+        batch = torch.ones(12, 8)
+        MegatronBertEmbeddingModel._maybe_graphed_contrastive_loss(model, batch)
+
+        assert eager_calls == [batch.shape]
+        assert model._graphed_contrastive_loss_key is None
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA graphs require a GPU")
+    def test_graphed_loss_matches_eager(self):
+        model = _contrastive_model()
+        batch_size, hidden_size = 4, 16
+        num_rows = batch_size * model.num_tensors_per_example
+
+        # Two replays make sure the static graph buffers are refreshed with each new input
+        for _ in range(2):
+            output_tensor = torch.nn.functional.normalize(torch.randn(num_rows, hidden_size, device='cuda'), dim=-1)
+            graphed_input = output_tensor.clone().requires_grad_()
+            eager_input = output_tensor.clone().requires_grad_()
+
+            graphed_loss = MegatronBertEmbeddingModel._maybe_graphed_contrastive_loss(model, graphed_input)
+            graphed_loss.backward()
+            eager_loss = model._contrastive_loss(eager_input)
+            eager_loss.backward()
+
+            torch.testing.assert_close(graphed_loss, eager_loss)
+            torch.testing.assert_close(graphed_input.grad, eager_input.grad)
+
+        assert model._graphed_contrastive_loss is not None
@@ -59,6 +59,83 @@ class MockTorchCheckpointIO(TorchCheckpointIO):
         self.save_checkpoint_called_args = args, kwargs
 
 
+class MockAsyncDistributedCheckpointIO(DistributedCheckpointIO):
+    def save_checkpoint(self, checkpoint, path, storage_options=None):
+        return ('async_request', path)
+
+
+class MockAsyncCallsQueue:
+    def __init__(self):
+        self.num_unfinalized_calls = 0
+        self.events = []
+
+    def get_num_unfinalized_calls(self):
+        return self.num_unfinalized_calls
+
+    def maybe_finalize_async_calls(self, blocking=False):
+        self.events.append(('finalize', blocking))
+        finalized = list(range(self.num_unfinalized_calls)) if blocking else []
+        if blocking:
+            self.num_unfinalized_calls = 0
+        return finalized
+
+    def schedule_async_request(self, async_request):
+        self.events.append(('schedule', async_request))
+        self.num_unfinalized_calls += 1
+        return self.num_unfinalized_calls
+
+
+class MockAsyncRequest:
+    def __init__(self):
+        self.finalize_fns = []
+
+    def add_finalize_fn(self, fn):
+        self.finalize_fns.append(fn)
+
+
+class RecordingAsyncDistributedCheckpointIO(DistributedCheckpointIO):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    def save_checkpoint(self, checkpoint, path, storage_options=None):
+        self.events.append(('save', path))
+        return MockAsyncRequest()
+
+
+class FinalizingMockAsyncCallsQueue(MockAsyncCallsQueue):
+    """Runs the finalize functions of pending requests on blocking finalization, like MCore."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending_requests = []
+
+    def maybe_finalize_async_calls(self, blocking=False):
+        finalized = super().maybe_finalize_async_calls(blocking)
+        if blocking:
+            for async_request in self.pending_requests:
+                for finalize_fn in async_request.finalize_fns:
+                    finalize_fn()
+            self.pending_requests = []
+        return finalized
+
+    def schedule_async_request(self, async_request):
+        self.pending_requests.append(async_request)
+        return super().schedule_async_request(async_request)
+
+
+class MockPersistentAsyncCallsQueue(MockAsyncCallsQueue):
+    def __init__(self, persistent=False):
+        super().__init__()
+        self.persistent = persistent
+        self.closed = False
+
+    def close(self):
+        # Like MCore, closing the queue finalizes any pending calls first
+        self.maybe_finalize_async_calls(blocking=True)
+        self.closed = True
+
+
 def _get_last_checkpoint_dir(root_dir: Path, model: pl.LightningModule, suffix: str = '') -> Path:
     steps = len(model.train_dataloader().dataset) * model.trainer.max_epochs // torch.distributed.get_world_size()
     return root_dir / 'checkpoints' / f'epoch={model.trainer.max_epochs - 1}-step={steps}{suffix}'
@@ -177,3 +254,77 @@ class TestAsyncSave:
 
         assert sync_state_dict['sharded_state_dict']['const'] == async_state_dict['sharded_state_dict']['const']
         assert torch.all(sync_state_dict['sharded_state_dict']['a'] == async_state_dict['sharded_state_dict']['a'])
+
+    def test_async_save_waits_for_previous_save(self):
+        checkpoint_io = AsyncFinalizableCheckpointIO(MockAsyncDistributedCheckpointIO('torch_dist', async_save=True))
+        checkpoint_io.async_calls_queue = MockAsyncCallsQueue()
+
+        checkpoint_io.save_checkpoint({}, 'first')
+        assert checkpoint_io.async_calls_queue.events == [('schedule', ('async_request', 'first'))]
+
+        # The pending save must be finalized before the next one is scheduled
+        checkpoint_io.save_checkpoint({}, 'second')
+        assert checkpoint_io.async_calls_queue.events[1:] == [
+            ('finalize', True),
+            ('schedule', ('async_request', 'second')),
+        ]
+        assert checkpoint_io.async_calls_queue.get_num_unfinalized_calls() == 1
+
+    def test_previous_save_finalized_inside_next_save(self):
+        checkpoint_io_base = RecordingAsyncDistributedCheckpointIO('torch_dist', async_save=True)
+        checkpoint_io = AsyncFinalizableCheckpointIO(checkpoint_io_base)
+        checkpoint_io.async_calls_queue = FinalizingMockAsyncCallsQueue()
+
+        # Mirrors ModelCheckpoint: a removal list is appended before each save and popped by its finalize_fn
+        deferred_ckpts_to_remove = []
+
+        def _get_finalize_fn(path):
+            def _finalize_fn():
+                checkpoint_io_base.events.append(('finalize', path, deferred_ckpts_to_remove.pop(0)))
+
+            return _finalize_fn
+
+        for path in ['first', 'second']:
+            deferred_ckpts_to_remove.append([f'{path}-stale'])
+            checkpoint_io.save_checkpoint({}, path, storage_options=dict(finalize_fn=_get_finalize_fn(path)))
+
+        # The first save's callback runs during the second save, before its request is created,
+        # and still pops the first save's entry
+        assert checkpoint_io_base.events == [
+            ('save', 'first'),
+            ('finalize', 'first', ['first-stale']),
+            ('save', 'second'),
+        ]
+        assert deferred_ckpts_to_remove == [['second-stale']]
+        assert checkpoint_io.async_calls_queue.get_num_unfinalized_calls() == 1
+
+    @pytest.mark.parametrize(
+        "queue_cls, expect_persistent",
+        [(MockPersistentAsyncCallsQueue, True), (MockAsyncCallsQueue, False)],
+    )
+    def test_async_save_persistent_worker(self, monkeypatch, queue_cls, expect_persistent):
+        # MockAsyncCallsQueue stands in for MCore versions without the `persistent` argument
+        monkeypatch.setattr('nemo.utils.callbacks.dist_ckpt_io.AsyncCallsQueue', queue_cls)
+        checkpoint_io = AsyncFinalizableCheckpointIO(
+            MockAsyncDistributedCheckpointIO('torch_dist', async_save=True), persistent_worker=True
+        )
+
+        assert checkpoint_io.persistent_worker == expect_persistent
+        assert getattr(checkpoint_io.async_calls_queue, 'persistent', False) == expect_persistent
+
+        checkpoint_io.teardown()
+        assert getattr(checkpoint_io.async_calls_queue, 'closed', False) == expect_persistent
+
+    def test_teardown_with_pending_saves_does_not_finalize(self, monkeypatch):
+        monkeypatch.setattr('nemo.utils.callbacks.dist_ckpt_io.AsyncCallsQueue', MockPersistentAsyncCallsQueue)
+        checkpoint_io = AsyncFinalizableCheckpointIO(
+            MockAsyncDistributedCheckpointIO('torch_dist', async_save=True), persistent_worker=True
+        )
+        checkpoint_io.save_checkpoint({}, 'pending')
+
+        checkpoint_io.teardown()
+
+        # Finalization is collective and some ranks might be lost, so teardown must not block on it
+        assert ('finalize', True) not in checkpoint_io.async_calls_queue.events
+        assert not checkpoint_io.async_calls_queue.closed
+        assert checkpoint_io.async_calls_queue.get_num_unfinalized_calls() == 1
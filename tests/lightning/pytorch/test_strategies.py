@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from pytorch_lightning.callbacks.progress import TQDMProgressBar
+
+from nemo import lightning as nl
+from nemo.lightning.pytorch.callbacks import MegatronProgressBar, ProgressPrinter
+
+
+class _CustomProgressBar(TQDMProgressBar):
+    pass
+
+
+def _trainer(callbacks):
+    return SimpleNamespace(callbacks=callbacks, is_global_zero=True)
+
+
+class TestFixProgressBar:
+    def test_existing_megatron_progress_bar_is_kept(self):
+        megatron_bar, plain_bar = MegatronProgressBar(), TQDMProgressBar()
+        trainer = _trainer([megatron_bar, plain_bar])
+
+        nl.MegatronStrategy(replace_progress_bar=False)._fix_progress_bar(trainer)
+
+        assert trainer.callbacks == [megatron_bar, plain_bar]
+        assert type(plain_bar) is TQDMProgressBar
+
+    def test_first_progress_bar_is_converted(self):
+        custom_bar, plain_bar = _CustomProgressBar(), TQDMProgressBar()
+        trainer = _trainer([custom_bar, plain_bar])
+
+        nl.MegatronStrategy(replace_progress_bar=False)._fix_progress_bar(trainer)
+
+        assert trainer.callbacks == [custom_bar, plain_bar]
+        assert type(custom_bar) is MegatronProgressBar
+        assert type(plain_bar) is TQDMProgressBar
+
+    def test_subclass_alone_is_not_converted(self):
+        custom_bar = _CustomProgressBar()
+        trainer = _trainer([custom_bar])
+
+        nl.MegatronStrategy(replace_progress_bar=False)._fix_progress_bar(trainer)
+
+        assert type(custom_bar) is _CustomProgressBar
+
+    def test_replace_progress_bar_with_printer(self):
+        plain_bar = TQDMProgressBar()
+        trainer = _trainer([plain_bar])
+
+        nl.MegatronStrategy(replace_progress_bar=True, progress_interval=5)._fix_progress_bar(trainer)
+
+        assert len(trainer.callbacks) == 1
+        printer = trainer.callbacks[0]
+        assert isinstance(printer, ProgressPrinter)
+        assert printer._trainer is trainer
+        assert printer._log_interval == 5
@@ -165,3 +165,74 @@ class TestDistCkptIO:
         assert base_checkpoint_io.save_ckpt_format == 'torch_dist'
         assert base_checkpoint_io.parallel_save
         assert base_checkpoint_io.load_directly_on_device == False
+
+    def test_sharded_structure_fingerprint(self):
+        from megatron.core.dist_checkpointing import ShardedTensor
+
+        from nemo.lightning.io.pl import _sharded_structure_fingerprint
+
+        def _state_dict(shape):
+            return {
+                'weight': ShardedTensor.from_rank_offsets('weight', torch.zeros(shape)),
+                'step': 10,
+            }
+
+        fingerprint = _sharded_structure_fingerprint(_state_dict((4, 8)))
+        assert fingerprint == _sharded_structure_fingerprint(_state_dict((4, 8)))
+        assert fingerprint != _sharded_structure_fingerprint(_state_dict((8, 8)))
+
+    @pytest.mark.parametrize(
+        "reuse_sharding_validation, expected_validations",
+        [(False, [True, True, True]), (True, [True, False, True])],
+    )
+    def test_sharding_validation_reuse(self, monkeypatch, tmp_path, reuse_sharding_validation, expected_validations):
+        from megatron.core import dist_checkpointing
+
+        # The third save sees a different sharding layout than the first two
+        fingerprints = iter([1, 1, 2])
+        monkeypatch.setattr(
+            'nemo.lightning.io.pl._sharded_structure_fingerprint', lambda checkpoint: next(fingerprints)
+        )
+        monkeypatch.setattr(torch.distributed, 'is_initialized', lambda: False)
+        validations = []
+        monkeypatch.setattr(
+            dist_checkpointing, 'save', lambda **kwargs: validations.append(kwargs['validate_access_integrity'])
+        )
+
+        checkpoint_io = MegatronCheckpointIO(reuse_sharding_validation=reuse_sharding_validation)
+        checkpoint_io._save_sharded_strategy = object()
+        for step in range(3):
+            checkpoint_io.save_checkpoint({}, tmp_path / f'step{step}.ckpt')
+
+        assert validations == expected_validations
+
+    def test_sharding_validation_reuse_requires_all_ranks(self, monkeypatch):
+        monkeypatch.setattr('nemo.lightning.io.pl._sharded_structure_fingerprint', lambda checkpoint: 1)
+        monkeypatch.setattr(torch.distributed, 'is_initialized', lambda: True)
+        monkeypatch.setattr(torch.distributed, 'get_backend', lambda: 'gloo')
+        reduce_ops = []
+
+        def _all_reduce(tensor, op):
+            reduce_ops.append(op)
+            # Another rank saw a different sharding layout
+            tensor.fill_(0)
+
+        monkeypatch.setattr(torch.distributed, 'all_reduce', _all_reduce)
+
+        checkpoint_io = MegatronCheckpointIO(reuse_sharding_validation=True)
+        checkpoint_io._sharded_structure_fingerprint = 1
+
+        assert not checkpoint_io._sharded_structure_unchanged({})
+        assert reduce_ops == [torch.distributed.ReduceOp.MIN]
+
+    def test_async_persistent_worker_strategy_flag(self, monkeypatch):
+        class _PersistentAsyncCallsQueue:
+            def __init__(self, persistent=False):
+                self.persistent = persistent
+
+        monkeypatch.setattr('nemo.utils.callbacks.dist_ckpt_io.AsyncCallsQueue', _PersistentAsyncCallsQueue)
+        strategy = nl.MegatronStrategy(ckpt_async_save=True, ckpt_async_persistent_worker=True)
+
+        assert isinstance(strategy.checkpoint_io, AsyncFinalizableCheckpointIO)
+        assert strategy.checkpoint_io.persistent_worker
+        assert strategy.checkpoint_io.async_calls_queue.persistent